@@ -7,14 +7,35 @@ which will then be picked up by the vm-controller to create virt-launcher pods.
 """
 
 import argparse
+import string
 import sys
 from scenario_loader import ScenarioLoader
 
+# VirtualMachine manifest, compiled once and filled in per VM
+_VM_TMPL = string.Template("""---
+apiVersion: simulation.node-classifier.io/v1alpha1
+kind: VirtualMachine
+metadata:
+  name: ${name}
+  namespace: default
+  labels:
+    scenario: ${scenario}
+    node: ${node}
+  annotations:
+    description: "From ${scenario} scenario, originally on ${node}"
+spec:
+  resources:
+    cpu: "${cpu}"
+    memory: "${memory}Gi"
+  utilization:
+    cpu: "${cpu_util}"
+    memory: "${mem_util}"
+  running: true
+""")
 
-def node_to_vms_yaml(node, scenario_name):
-    """Convert a Node with VMs into VirtualMachine YAML manifests."""
-    yamls = []
 
+def node_to_vms_yaml(node, scenario_name):
+    """Yield VirtualMachine YAML manifests for a Node's VMs."""
     for vm in node.vms:
         # Calculate CPU cores and memory from consumption
         # Assuming 32 cores and 128Gi per KWOK node
@@ -27,48 +48,28 @@ def node_to_vms_yaml(node, scenario_name):
         cpu_util = vm.cpu_utilization if hasattr(vm, 'cpu_utilization') else 0.5
         mem_util = vm.memory_utilization if hasattr(vm, 'memory_utilization') else 0.7
 
-        yaml = f"""---
-apiVersion: simulation.node-classifier.io/v1alpha1
-kind: VirtualMachine
-metadata:
-  name: {vm.id}
-  namespace: default
-  labels:
-    scenario: {scenario_name}
-    node: {node.name}
-  annotations:
-    description: "From {scenario_name} scenario, originally on {node.name}"
-spec:
-  resources:
-    cpu: "{cpu_cores:.2f}"
-    memory: "{memory_gi:.2f}Gi"
-  utilization:
-    cpu: "{cpu_util:.2f}"
-    memory: "{mem_util:.2f}"
-  running: true
-"""
-        yamls.append(yaml)
-
-    return yamls
+        yield _VM_TMPL.substitute(
+            name=vm.id,
+            scenario=scenario_name,
+            node=node.name,
+            cpu=f"{cpu_cores:.2f}",
+            memory=f"{memory_gi:.2f}",
+            cpu_util=f"{cpu_util:.2f}",
+            mem_util=f"{mem_util:.2f}"
+        )
 
 
 def generate_scenario_yaml(scenario_name):
-    """Generate VirtualMachine YAML for a scenario."""
-    scenarios = ScenarioLoader.create_sample_scenarios()
-
-    if scenario_name not in scenarios:
-        print(f"Error: Scenario '{scenario_name}' not found.", file=sys.stderr)
-        print(f"Available scenarios: {', '.join(scenarios.keys())}", file=sys.stderr)
-        return None
-
-    nodes = scenarios[scenario_name]
-    all_yamls = []
+    """Yield VirtualMachine YAML for a scenario, chunk by chunk."""
+    nodes = ScenarioLoader.create_sample_scenarios()[scenario_name]
+    first = True
 
     for node in nodes:
-        yamls = node_to_vms_yaml(node, scenario_name)
-        all_yamls.extend(yamls)
-
-    return '\n'.join(all_yamls)
+        for yaml in node_to_vms_yaml(node, scenario_name):
+            if not first:
+                yield '\n'
+            first = False
+            yield yaml
 
 
 def main():
@@ -95,23 +96,27 @@ def main():
     args = parser.parse_args()
 
     if args.list:
-        scenarios = ScenarioLoader.create_sample_scenarios()
         print("Available scenarios:")
-        for name, nodes in scenarios.items():
-            total_vms = sum(len(node.vms) for node in nodes)
-            print(f"  - {name}: {len(nodes)} nodes, {total_vms} VMs")
+        for name in ScenarioLoader.list_scenario_names():
+            print(f"  - {name}: {len(ScenarioLoader.SAMPLE_SCENARIO_NODES[name])} nodes")
         return 0
 
-    yaml_content = generate_scenario_yaml(args.scenario)
-    if yaml_content is None:
+    scenario_names = ScenarioLoader.list_scenario_names()
+    if args.scenario not in scenario_names:
+        print(f"Error: Scenario '{args.scenario}' not found.", file=sys.stderr)
+        print(f"Available scenarios: {', '.join(scenario_names)}", file=sys.stderr)
         return 1
 
+    # Stream manifests straight to the sink instead of building one big string
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(yaml_content)
+            for chunk in generate_scenario_yaml(args.scenario):
+                f.write(chunk)
         print(f"Generated {args.output} from scenario '{args.scenario}'", file=sys.stderr)
     else:
-        print(yaml_content)
+        for chunk in generate_scenario_yaml(args.scenario):
+            sys.stdout.write(chunk)
+        sys.stdout.write('\n')
 
     return 0
 
@@ -15,8 +15,11 @@ import math
 import threading
 import random
 import json
+import heapq
+import functools
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 import re
@@ -30,10 +33,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matched with fullmatch() so trailing garbage (e.g. '24hx') is rejected
+_DURATION_RE = re.compile(r'(\d+)([smhd])')
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
 
+# Shared Kubernetes API client, configured once per process (see _get_api_client)
+_API_CLIENT: Optional[client.ApiClient] = None
+_API_CLIENT_LOCK = threading.Lock()
+
+# Shared RNG for task sampling, kept separate from the global random state
+_RNG = random.Random()
+
+# Above this lambda exp(-lambda) nears float underflow, so Poisson draws use
+# the normal approximation (which is very accurate there) instead
+_POISSON_NORMAL_APPROX_LAMBDA = 500.0
+
+# Real-time intervals of the executor main loop
+TICK_INTERVAL_SECONDS = 1.0
+STATUS_INTERVAL_SECONDS = 10.0
+MIN_SLEEP_SECONDS = 0.05
+
+
+@functools.lru_cache(maxsize=256)
 def parse_duration(duration_str: str) -> timedelta:
     """Parse duration string like '24h', '7d', '30m' into timedelta."""
-    match = re.match(r'(\d+)([smhd])', duration_str)
+    match = _DURATION_RE.fullmatch(duration_str)
     if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
@@ -54,7 +78,7 @@ def parse_time(time_str: str) -> Optional[timedelta]:
         return parse_duration(time_str[1:])
 
     # Parse HH:MM format
-    match = re.match(r'(\d{1,2}):(\d{2})', time_str)
+    match = _TIME_RE.fullmatch(time_str)
     if match:
         hours, minutes = int(match.group(1)), int(match.group(2))
         return timedelta(hours=hours, minutes=minutes)
@@ -62,40 +86,131 @@ def parse_time(time_str: str) -> Optional[timedelta]:
     return None
 
 
-def sample_from_distribution(config: Dict[str, Any]) -> float:
-    """Sample a value from a distribution specification."""
+def _uniform_sampler(min_val: float, max_val: float, config: Dict[str, Any]) -> Callable[[], float]:
+    uniform = _RNG.uniform
+    return lambda: uniform(min_val, max_val)
+
+
+def _normal_sampler(min_val: float, max_val: float, config: Dict[str, Any]) -> Callable[[], float]:
+    mean = float(config.get('mean', (min_val + max_val) / 2))
+    stddev = float(config.get('stddev', (max_val - min_val) / 6))
+    gauss = _RNG.gauss
+    return lambda: max(min_val, min(max_val, gauss(mean, stddev)))
+
+
+def _exponential_sampler(min_val: float, max_val: float, config: Dict[str, Any]) -> Callable[[], float]:
+    mean = float(config.get('mean', (min_val + max_val) / 2))
+    lambd = 1.0 / mean
+    expovariate = _RNG.expovariate
+    return lambda: max(min_val, min(max_val, expovariate(lambd)))
+
+
+def _poisson_sampler(min_val: float, max_val: float, config: Dict[str, Any]) -> Callable[[], float]:
+    lambda_val = float(config.get('lambda', 1.0))
+
+    if lambda_val > _POISSON_NORMAL_APPROX_LAMBDA:
+        gauss = _RNG.gauss
+        stddev = math.sqrt(lambda_val)
+        return lambda: min(max_val, max(0, round(gauss(lambda_val, stddev))))
+
+    L = math.exp(-lambda_val)
+    rand = _RNG.random
+
+    def draw() -> float:
+        # Inverse transform sampling: one uniform draw per sample (no numpy required)
+        u = rand()
+        k, p, cdf = 0, L, L
+        while u > cdf and p > 0:
+            k += 1
+            p *= lambda_val / k
+            cdf += p
+        return min(max_val, k)
+
+    return draw
+
+
+def _fallback_sampler(min_val: float, max_val: float, config: Dict[str, Any]) -> Callable[[], float]:
+    return lambda: min_val
+
+
+# Distribution name -> factory(min_val, max_val, config) returning a sampler
+_SAMPLERS = {
+    'uniform': _uniform_sampler,
+    'normal': _normal_sampler,
+    'exponential': _exponential_sampler,
+    'poisson': _poisson_sampler,
+}
+
+
+def make_sampler(config: Dict[str, Any]) -> Callable[[], float]:
+    """Parse a distribution specification once into a zero-argument sampler."""
     if 'value' in config:
-        return float(config['value'])
+        value = float(config['value'])
+        return lambda: value
 
-    dist_type = config.get('distribution', 'uniform')
     min_val = float(config.get('min', 0))
     max_val = float(config.get('max', 1))
+    factory = _SAMPLERS.get(config.get('distribution', 'uniform'), _fallback_sampler)
+    return factory(min_val, max_val, config)
 
-    if dist_type == 'uniform':
-        return random.uniform(min_val, max_val)
-    elif dist_type == 'normal':
-        mean = float(config.get('mean', (min_val + max_val) / 2))
-        stddev = float(config.get('stddev', (max_val - min_val) / 6))
-        value = random.gauss(mean, stddev)
-        return max(min_val, min(max_val, value))
-    elif dist_type == 'exponential':
-        mean = float(config.get('mean', (min_val + max_val) / 2))
-        value = random.expovariate(1.0 / mean)
-        return max(min_val, min(max_val, value))
-    elif dist_type == 'poisson':
-        lambda_val = float(config.get('lambda', 1.0))
-        # Knuth's algorithm for Poisson sampling (no numpy required)
-        L = math.exp(-lambda_val)
-        k, p = 0, 1.0
-        while p > L:
-            k += 1
-            p *= random.random()
-        return min(max_val, k - 1)
 
-    return min_val
+def _get_api_client() -> client.ApiClient:
+    """Load the Kubernetes configuration on first use and return the shared API client."""
+    global _API_CLIENT
+    with _API_CLIENT_LOCK:
+        if _API_CLIENT is None:
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config()
+            _API_CLIENT = client.ApiClient()
+        return _API_CLIENT
+
+
+def _minute_of_day(hm: str) -> int:
+    """Convert an 'HH:MM' string into minutes since midnight."""
+    match = _TIME_RE.fullmatch(hm)
+    if not match:
+        raise ValueError(f"Invalid time of day: {hm}")
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def compile_active_windows(windows: List[Dict[str, str]]) -> Tuple[List[int], List[int]]:
+    """
+    Pre-parse activeWindows into parallel (starts, ends) lists of minutes since midnight.
+
+    Overlapping windows are merged so a single bisect on starts finds the only
+    window that can contain a given minute.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted((_minute_of_day(w.get('start', '00:00')), _minute_of_day(w.get('end', '23:59')))
+                             for w in windows):
+        if start > end:
+            continue  # Windows wrapping past midnight never match
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def sample_from_distribution(config: Dict[str, Any]) -> float:
+    """Sample a value from a distribution specification."""
+    return make_sampler(config)()
+
+
+def sample_many(config: Dict[str, Any], count: int) -> List[float]:
+    """Draw `count` values from a distribution specification, parsing it only once."""
+    if 'value' in config:
+        return [float(config['value'])] * count
+
+    draw = make_sampler(config)
+    return [draw() for _ in range(count)]
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveTask:
     """Represents an active task running on a VM."""
     vm_id: str
@@ -105,12 +220,141 @@ class ActiveTask:
     description: str = ""
 
 
+@dataclass(slots=True)
+class TaskGeneratorState:
+    """Scheduling state of a task generator driven by the executor loop."""
+    name: str
+    config: Dict[str, Any]
+    interval: float  # Real seconds between runs (already adjusted for time scale)
+    active_windows: Optional[Tuple[List[int], List[int]]]  # See compile_active_windows
+    next_run_at: float  # time.monotonic() deadline
+
+
+def _pod_consumption(pod) -> Tuple[float, float]:
+    """Read (cpu, memory) consumption from a virt-launcher pod's annotations."""
+    annotations = pod.metadata.annotations or {}
+    cpu = float(annotations.get('vm.simulation.io/cpu-consumption', 0))
+    memory = float(annotations.get('vm.simulation.io/memory-consumption', 0))
+    return cpu, memory
+
+
+class PodCache:
+    """Watch-backed cache of virt-launcher pod resource consumption, indexed by node."""
+
+    def __init__(self, k8s_api: client.CoreV1Api, namespace: str = "default"):
+        self.k8s_api = k8s_api
+        self.namespace = namespace
+        self.running = False
+
+        # node -> {pod name -> (cpu, memory)}, pod name -> node
+        self._pods_by_node: Dict[str, Dict[str, Tuple[float, float]]] = defaultdict(dict)
+        self._pod_to_node: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def node_totals(self, node_name: str) -> Tuple[float, float]:
+        """Return the summed (cpu, memory) consumption of pods on a node."""
+        with self._lock:
+            pods = self._pods_by_node.get(node_name, {})
+            return (sum(v[0] for v in pods.values()), sum(v[1] for v in pods.values()))
+
+    def start(self):
+        """Populate the cache and keep it updated in a background thread."""
+        self.running = True
+        try:
+            resource_version = self._list_pods()
+        except ApiException as e:
+            logger.error(f"Error listing virt-launcher pods: {e}")
+            resource_version = None
+
+        t = threading.Thread(target=self._watch_pods, args=(resource_version,), daemon=True, name="pod-cache")
+        t.start()
+
+    def stop(self):
+        """Stop the background watch."""
+        self.running = False
+
+    def _set_pod(self, pod_name: str, node_name: Optional[str], consumption: Tuple[float, float]):
+        """Record a pod's node and consumption (node None removes it from the cache)."""
+        with self._lock:
+            old_node = self._pod_to_node.pop(pod_name, None)
+            if old_node is not None:
+                pods = self._pods_by_node[old_node]
+                pods.pop(pod_name, None)
+                if not pods:
+                    del self._pods_by_node[old_node]
+
+            if node_name:
+                self._pod_to_node[pod_name] = node_name
+                self._pods_by_node[node_name][pod_name] = consumption
+
+    def _list_pods(self) -> Optional[str]:
+        """Rebuild the cache from a full LIST; returns its resourceVersion."""
+        pods = self.k8s_api.list_namespaced_pod(namespace=self.namespace, label_selector="app=virt-launcher")
+
+        pods_by_node: Dict[str, Dict[str, Tuple[float, float]]] = defaultdict(dict)
+        pod_to_node: Dict[str, str] = {}
+        for pod in pods.items:
+            node_name = pod.spec.node_name
+            if node_name:
+                pod_to_node[pod.metadata.name] = node_name
+                pods_by_node[node_name][pod.metadata.name] = _pod_consumption(pod)
+
+        with self._lock:
+            self._pods_by_node = pods_by_node
+            self._pod_to_node = pod_to_node
+
+        return pods.metadata.resource_version
+
+    def _watch_pods(self, resource_version: Optional[str]):
+        """Apply virt-launcher pod watch events to the cache."""
+        w = watch.Watch()
+
+        while self.running:
+            try:
+                if resource_version is None:
+                    resource_version = self._list_pods()
+
+                for event in w.stream(
+                    self.k8s_api.list_namespaced_pod,
+                    namespace=self.namespace,
+                    label_selector="app=virt-launcher",
+                    resource_version=resource_version,
+                    timeout_seconds=60
+                ):
+                    if not self.running:
+                        break
+
+                    event_type = event['type']
+                    pod = event['object']
+                    resource_version = pod.metadata.resource_version or resource_version
+
+                    if event_type == 'DELETED':
+                        self._set_pod(pod.metadata.name, None, (0.0, 0.0))
+                    elif event_type in ('ADDED', 'MODIFIED'):
+                        self._set_pod(pod.metadata.name, pod.spec.node_name, _pod_consumption(pod))
+
+            except ApiException as e:
+                if e.status == 410:
+                    logger.warning("Pod watch resource version too old, re-listing")
+                    resource_version = None
+                    continue
+                logger.error(f"API exception in pod cache watch: {e}")
+                time.sleep(5)
+            except Exception as e:
+                logger.error(f"Unexpected error in pod cache watch: {e}")
+                time.sleep(5)
+
+        w.stop()
+
+
 class NodeSelector:
     """Handles node selection based on various strategies."""
 
-    def __init__(self, k8s_api: client.CoreV1Api, custom_api: client.CustomObjectsApi):
+    def __init__(self, k8s_api: client.CoreV1Api, custom_api: client.CustomObjectsApi,
+                 pod_cache: Optional[PodCache] = None):
         self.k8s_api = k8s_api
         self.custom_api = custom_api
+        self.pod_cache = pod_cache
 
     def select_nodes(self, selector_config: Dict[str, Any], namespace: str = "default") -> List[str]:
         """Select nodes based on selector configuration."""
@@ -191,24 +435,11 @@ class NodeSelector:
 
     def _get_node_metric(self, node_name: str, metric: str, namespace: str) -> Optional[float]:
         """Get current metric value for a node."""
-        # Get all virt-launcher pods on this node
         try:
-            pods = self.k8s_api.list_namespaced_pod(
-                namespace=namespace,
-                label_selector="app=virt-launcher",
-                field_selector=f"spec.nodeName={node_name}"
-            )
-
-            # Sum up resource consumption from pod annotations
-            total_cpu = 0.0
-            total_memory = 0.0
-
-            for pod in pods.items:
-                annotations = pod.metadata.annotations or {}
-                cpu = float(annotations.get('vm.simulation.io/cpu-consumption', 0))
-                memory = float(annotations.get('vm.simulation.io/memory-consumption', 0))
-                total_cpu += cpu
-                total_memory += memory
+            if self.pod_cache is not None and self.pod_cache.namespace == namespace:
+                total_cpu, total_memory = self.pod_cache.node_totals(node_name)
+            else:
+                total_cpu, total_memory = self._list_node_consumption(node_name, namespace)
 
             if metric == 'cpu_usage':
                 return total_cpu
@@ -221,24 +452,41 @@ class NodeSelector:
 
         return None
 
+    def _list_node_consumption(self, node_name: str, namespace: str) -> Tuple[float, float]:
+        """Sum resource consumption of virt-launcher pods on a node straight from the API."""
+        pods = self.k8s_api.list_namespaced_pod(
+            namespace=namespace,
+            label_selector="app=virt-launcher",
+            field_selector=f"spec.nodeName={node_name}"
+        )
+
+        # Sum up resource consumption from pod annotations
+        total_cpu = 0.0
+        total_memory = 0.0
+
+        for pod in pods.items:
+            cpu, memory = _pod_consumption(pod)
+            total_cpu += cpu
+            total_memory += memory
+
+        return total_cpu, total_memory
+
 
 class ScenarioExecutor:
     """Executes a simulation scenario."""
 
-    def __init__(self, scenario_name: str, scenario_spec: Dict[str, Any], namespace: str = "default"):
+    def __init__(self, scenario_name: str, scenario_spec: Dict[str, Any], namespace: str = "default",
+                 api_client: Optional[client.ApiClient] = None):
         self.scenario_name = scenario_name
         self.spec = scenario_spec
         self.namespace = namespace
 
         # Kubernetes clients
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-
-        self.k8s_api = client.CoreV1Api()
-        self.custom_api = client.CustomObjectsApi()
-        self.node_selector = NodeSelector(self.k8s_api, self.custom_api)
+        api_client = api_client or _get_api_client()
+        self.k8s_api = client.CoreV1Api(api_client)
+        self.custom_api = client.CustomObjectsApi(api_client)
+        self.pod_cache = PodCache(self.k8s_api, self.namespace)
+        self.node_selector = NodeSelector(self.k8s_api, self.custom_api, self.pod_cache)
 
         # Simulation state
         self.start_time = datetime.now()
@@ -250,6 +498,20 @@ class ScenarioExecutor:
         # Active tasks (VM -> list of active tasks)
         self.active_tasks: Dict[str, List[ActiveTask]] = defaultdict(list)
 
+        # Running resource totals of active tasks (VM -> [cpu, memory])
+        self._vm_totals: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0.0])
+
+        # Min-heap of (end_time, id(task), task) across all VMs, so cleanup only touches expired tasks
+        self._task_heap: List[Tuple[datetime, int, ActiveTask]] = []
+
+        # Cached VM placement, kept current by a watch (node -> VM IDs, VM ID -> node)
+        self._node_to_vms: Dict[str, Set[str]] = defaultdict(set)
+        self._vm_to_node: Dict[str, str] = {}
+        self._vm_placement_lock = threading.Lock()
+
+        # Last utilization pushed to each VM CR, in hundredths (VM -> (cpu, memory))
+        self._last_sent_utilization: Dict[str, Tuple[int, int]] = {}
+
         # Statistics
         self.total_tasks_generated = 0
 
@@ -307,31 +569,60 @@ class ScenarioExecutor:
         self.update_status('Running', 'Scenario started')
 
         try:
-            # Start task generator threads
-            generator_threads = []
-            for gen_config in self.spec.get('taskGenerators', []):
-                if gen_config.get('enabled', True):
-                    t = threading.Thread(target=self._run_task_generator, args=(gen_config,), daemon=True)
-                    t.start()
-                    generator_threads.append(t)
-
-            # Main simulation loop
+            # Cache VM placement and pod consumption so generators don't LIST per tick
+            self._start_vm_placement_watch()
+            self.pod_cache.start()
+
+            # Main simulation loop, driven by monotonic deadlines so sleep drift
+            # neither skips nor repeats periodic work. Task generators are
+            # scheduled on the same loop rather than each getting a thread.
+            next_tick_at = time.monotonic()
+            generators = [
+                self._create_task_generator(gen_config, next_tick_at)
+                for gen_config in self.spec.get('taskGenerators', [])
+                if gen_config.get('enabled', True)
+            ]
+            next_cleanup_at = next_tick_at
+            next_status_at = next_tick_at + STATUS_INTERVAL_SECONDS
+
             while self.running and not self.is_complete():
-                if not self.paused:
-                    # Clean up completed tasks
+                if self.paused:
+                    time.sleep(TICK_INTERVAL_SECONDS)
+                    continue
+
+                now = time.monotonic()
+                if now >= next_cleanup_at:
+                    # Clean up completed tasks, then wake for the next expiry (at most a tick away)
                     self._cleanup_completed_tasks()
+                    next_cleanup_at = now + min(TICK_INTERVAL_SECONDS, self._seconds_until_next_expiry())
+
+                for gen in generators:
+                    if now >= gen.next_run_at:
+                        self._run_task_generator(gen, now)
 
+                if now >= next_tick_at:
                     # Check timeline events
                     self._check_timeline_events()
 
                     # Check conditional events
                     self._check_conditional_events()
 
-                    # Update status periodically
-                    if int(time.time()) % 10 == 0:
-                        self.update_status('Running', f'Simulated time: {self.get_simulated_time().strftime("%H:%M:%S")}')
+                    next_tick_at = now + TICK_INTERVAL_SECONDS
 
-                time.sleep(1)  # Real time sleep
+                # Update status periodically
+                if now >= next_status_at:
+                    self.update_status('Running', f'Simulated time: {self.get_simulated_time().strftime("%H:%M:%S")}')
+                    next_status_at += STATUS_INTERVAL_SECONDS
+                    if next_status_at <= now:
+                        next_status_at = now + STATUS_INTERVAL_SECONDS
+
+                next_wakeup = min(next_tick_at, next_cleanup_at, next_status_at,
+                                  *(gen.next_run_at for gen in generators))
+                sleep_for = next_wakeup - time.monotonic()
+                time.sleep(max(MIN_SLEEP_SECONDS, sleep_for))  # Real time sleep
+
+            for gen in generators:
+                logger.info(f"Stopped task generator: {gen.name}")
 
             # Scenario completed
             self.running = False
@@ -342,56 +633,53 @@ class ScenarioExecutor:
             logger.error(f"Scenario execution failed: {e}", exc_info=True)
             self.update_status('Failed', str(e))
             self.running = False
+        finally:
+            self.pod_cache.stop()
 
-    def _run_task_generator(self, gen_config: Dict[str, Any]):
-        """Run a task generator in a separate thread."""
+    def _create_task_generator(self, gen_config: Dict[str, Any], start_at: float) -> TaskGeneratorState:
+        """Parse a task generator configuration into its scheduling state."""
         gen_name = gen_config.get('name', 'unnamed')
-        logger.info(f"Started task generator: {gen_name}")
-
-        schedule_type = gen_config.get('schedule', {}).get('type', 'periodic')
-        interval_str = gen_config.get('schedule', {}).get('interval', '1m')
-        interval = parse_duration(interval_str)
+        schedule = gen_config.get('schedule', {})
+        interval = parse_duration(schedule.get('interval', '1m'))
+        windows = schedule.get('activeWindows', [])
 
-        while self.running and not self.is_complete():
-            if self.paused:
-                time.sleep(1)
-                continue
-
-            # Check if we're in an active window
-            if not self._is_in_active_window(gen_config):
-                time.sleep(1)
-                continue
-
-            # Generate tasks
-            try:
-                self._generate_tasks(gen_config)
-            except Exception as e:
-                logger.error(f"Error in task generator '{gen_name}': {e}", exc_info=True)
+        logger.info(f"Started task generator: {gen_name}")
+        return TaskGeneratorState(
+            name=gen_name,
+            config=gen_config,
+            interval=interval.total_seconds() / self.time_scale,
+            active_windows=compile_active_windows(windows) if windows else None,
+            next_run_at=start_at
+        )
+
+    def _run_task_generator(self, gen: TaskGeneratorState, now: float):
+        """Run one due iteration of a task generator and schedule its next run."""
+        # Check if we're in an active window
+        if not self._is_in_active_window(gen.active_windows):
+            gen.next_run_at = now + TICK_INTERVAL_SECONDS
+            return
 
-            # Sleep for interval (adjusted for time scale)
-            sleep_time = interval.total_seconds() / self.time_scale
-            time.sleep(sleep_time)
+        # Generate tasks
+        try:
+            self._generate_tasks(gen.config)
+        except Exception as e:
+            logger.error(f"Error in task generator '{gen.name}': {e}", exc_info=True)
 
-        logger.info(f"Stopped task generator: {gen_name}")
+        # Next run after the interval (adjusted for time scale)
+        gen.next_run_at = now + gen.interval
 
-    def _is_in_active_window(self, gen_config: Dict[str, Any]) -> bool:
-        """Check if current simulated time is in an active window."""
-        windows = gen_config.get('schedule', {}).get('activeWindows', [])
-        if not windows:
+    def _is_in_active_window(self, active_windows: Optional[Tuple[List[int], List[int]]]) -> bool:
+        """Check if current simulated time is in an active window (see compile_active_windows)."""
+        if active_windows is None:
             return True  # No windows = always active
 
+        starts, ends = active_windows
         sim_time = self.get_simulated_time()
-        current_hm = sim_time.strftime("%H:%M")
-
-        for window in windows:
-            start = window.get('start', '00:00')
-            end = window.get('end', '23:59')
+        minute = sim_time.hour * 60 + sim_time.minute
 
-            if start <= current_hm <= end:
-                # TODO: Apply weight to rate
-                return True
-
-        return False
+        # TODO: Apply weight to rate
+        i = bisect_right(starts, minute) - 1
+        return i >= 0 and minute <= ends[i]
 
     def _generate_tasks(self, gen_config: Dict[str, Any]):
         """Generate and assign tasks based on generator configuration."""
@@ -413,33 +701,45 @@ class ScenarioExecutor:
         task_type_name = gen_config.get('taskType')
         task_type = self.spec.get('taskTypes', {}).get(task_type_name, {})
 
-        # Generate and assign tasks
-        for _ in range(num_tasks):
-            # Sample task parameters
-            cpu = sample_from_distribution(task_type.get('resources', {}).get('cpu', {'value': 0.1}))
-            memory = sample_from_distribution(task_type.get('resources', {}).get('memory', {'value': 0.1}))
-            duration = sample_from_distribution(task_type.get('duration', {'value': 60}))  # seconds
+        # Sample task parameters for the whole batch up front
+        resources = task_type.get('resources', {})
+        cpus = sample_many(resources.get('cpu', {'value': 0.1}), num_tasks)
+        memories = sample_many(resources.get('memory', {'value': 0.1}), num_tasks)
+        durations = sample_many(task_type.get('duration', {'value': 60}), num_tasks)  # seconds
+
+        # Pick all target VMs in one go
+        chosen_vms = _RNG.choices(target_vms, k=num_tasks)
 
-            # Pick a VM
-            vm_id = random.choice(target_vms)
+        now = datetime.now()
+        description = f"Task from {gen_config.get('name')}"
 
-            # Create and assign task
-            task = ActiveTask(
+        # Create tasks grouped by VM
+        grouped: Dict[str, List[ActiveTask]] = defaultdict(list)
+        for vm_id, cpu, memory, duration in zip(chosen_vms, cpus, memories, durations):
+            grouped[vm_id].append(ActiveTask(
                 vm_id=vm_id,
                 cpu=cpu,
                 memory=memory,
-                end_time=datetime.now() + timedelta(seconds=duration / self.time_scale),
-                description=f"Task from {gen_config.get('name')}"
-            )
+                end_time=now + timedelta(seconds=duration / self.time_scale),
+                description=description
+            ))
 
-            self.active_tasks[vm_id].append(task)
-            self.total_tasks_generated += 1
+            logger.debug(f"Assigned task to {vm_id}: CPU={cpu:.2f}, MEM={memory:.2f}, duration={duration}s")
 
-            # Update VM utilization immediately
+        # Assign tasks
+        for vm_id, tasks in grouped.items():
+            self.active_tasks[vm_id].extend(tasks)
+            totals = self._vm_totals[vm_id]
+            for task in tasks:
+                heapq.heappush(self._task_heap, (task.end_time, id(task), task))
+                totals[0] += task.cpu
+                totals[1] += task.memory
+        self.total_tasks_generated += num_tasks
+
+        # Push utilization once per touched VM rather than once per task
+        for vm_id in grouped:
             self._update_vm_utilization(vm_id)
 
-            logger.debug(f"Assigned task to {vm_id}: CPU={cpu:.2f}, MEM={memory:.2f}, duration={duration}s")
-
     def _select_target_vms(self, config: Dict[str, Any]) -> List[str]:
         """Select target VMs based on assignment configuration."""
         assignment = config.get('assignment', {})
@@ -477,60 +777,134 @@ class ScenarioExecutor:
 
     def _get_vms_on_node(self, node_name: str) -> List[str]:
         """Get list of VM IDs on a specific node."""
+        with self._vm_placement_lock:
+            return list(self._node_to_vms.get(node_name, ()))
+
+    def _set_vm_node(self, vm_id: str, node_name: Optional[str]):
+        """Record which node a VM is on (None removes it from the cache)."""
+        with self._vm_placement_lock:
+            old_node = self._vm_to_node.pop(vm_id, None)
+            if old_node is not None:
+                vms = self._node_to_vms[old_node]
+                vms.discard(vm_id)
+                if not vms:
+                    del self._node_to_vms[old_node]
+
+            if node_name:
+                self._vm_to_node[vm_id] = node_name
+                self._node_to_vms[node_name].add(vm_id)
+
+    def _list_vm_placement(self) -> Optional[str]:
+        """Rebuild the VM placement cache from a full LIST; returns its resourceVersion."""
+        vms = self.custom_api.list_namespaced_custom_object(
+            group="simulation.node-classifier.io",
+            version="v1alpha1",
+            namespace=self.namespace,
+            plural="virtualmachines"
+        )
+
+        node_to_vms: Dict[str, Set[str]] = defaultdict(set)
+        vm_to_node: Dict[str, str] = {}
+        for vm in vms.get('items', []):
+            node_name = vm.get('status', {}).get('nodeName')
+            if node_name:
+                vm_id = vm['metadata']['name']
+                vm_to_node[vm_id] = node_name
+                node_to_vms[node_name].add(vm_id)
+
+        with self._vm_placement_lock:
+            self._node_to_vms = node_to_vms
+            self._vm_to_node = vm_to_node
+
+        return vms.get('metadata', {}).get('resourceVersion')
+
+    def _start_vm_placement_watch(self):
+        """Populate the VM placement cache and keep it updated in a background thread."""
         try:
-            vms = self.custom_api.list_namespaced_custom_object(
-                group="simulation.node-classifier.io",
-                version="v1alpha1",
-                namespace=self.namespace,
-                plural="virtualmachines"
-            )
-
-            result = []
-            for vm in vms.get('items', []):
-                status = vm.get('status', {})
-                if status.get('nodeName') == node_name:
-                    result.append(vm['metadata']['name'])
-
-            return result
+            resource_version = self._list_vm_placement()
         except ApiException as e:
-            logger.error(f"Error getting VMs on node {node_name}: {e}")
-            return []
+            logger.error(f"Error listing VMs: {e}")
+            resource_version = None
+
+        t = threading.Thread(
+            target=self._watch_vm_placement,
+            args=(resource_version,),
+            daemon=True,
+            name=f"vm-placement-{self.scenario_name}"
+        )
+        t.start()
 
-    def _update_vm_utilization(self, vm_id: str):
-        """Update VM utilization based on active tasks."""
-        tasks = self.active_tasks.get(vm_id, [])
+    def _watch_vm_placement(self, resource_version: Optional[str]):
+        """Apply VirtualMachine watch events to the VM placement cache."""
+        w = watch.Watch()
 
-        # Sum up all active tasks
-        total_cpu = sum(task.cpu for task in tasks)
-        total_memory = sum(task.memory for task in tasks)
+        while self.running:
+            try:
+                if resource_version is None:
+                    resource_version = self._list_vm_placement()
 
-        # Update VM CR
-        try:
-            vm = self.custom_api.get_namespaced_custom_object(
-                group="simulation.node-classifier.io",
-                version="v1alpha1",
-                namespace=self.namespace,
-                plural="virtualmachines",
-                name=vm_id
-            )
+                for event in w.stream(
+                    self.custom_api.list_namespaced_custom_object,
+                    group="simulation.node-classifier.io",
+                    version="v1alpha1",
+                    namespace=self.namespace,
+                    plural="virtualmachines",
+                    resource_version=resource_version,
+                    timeout_seconds=60
+                ):
+                    if not self.running:
+                        break
 
-            # Update utilization in spec
-            if 'spec' not in vm:
-                vm['spec'] = {}
-            if 'utilization' not in vm['spec']:
-                vm['spec']['utilization'] = {}
+                    event_type = event['type']
+                    vm = event['object']
+                    metadata = vm.get('metadata', {})
+                    resource_version = metadata.get('resourceVersion', resource_version)
+
+                    if event_type == 'DELETED':
+                        self._set_vm_node(metadata['name'], None)
+                    elif event_type in ('ADDED', 'MODIFIED'):
+                        self._set_vm_node(metadata['name'], vm.get('status', {}).get('nodeName'))
+
+            except ApiException as e:
+                if e.status == 410:
+                    logger.warning("VM watch resource version too old, re-listing")
+                    resource_version = None
+                    continue
+                logger.error(f"API exception in VM placement watch: {e}")
+                time.sleep(5)
+            except Exception as e:
+                logger.error(f"Unexpected error in VM placement watch: {e}")
+                time.sleep(5)
 
-            vm['spec']['utilization']['cpu'] = str(min(1.0, total_cpu))
-            vm['spec']['utilization']['memory'] = str(min(1.0, total_memory))
+        w.stop()
 
+    def _update_vm_utilization(self, vm_id: str):
+        """Update VM utilization based on active tasks."""
+        total_cpu, total_memory = self._vm_totals.get(vm_id, (0.0, 0.0))
+
+        # Quantize to the 2 decimals we publish and skip the API round-trip
+        # if that value hasn't changed since the last update
+        utilization = (
+            round(max(0.0, min(1.0, total_cpu)) * 100),
+            round(max(0.0, min(1.0, total_memory)) * 100)
+        )
+        if self._last_sent_utilization.get(vm_id) == utilization:
+            return
+
+        # Update VM CR with a partial (merge) patch - no need to GET the full object first
+        try:
             self.custom_api.patch_namespaced_custom_object(
                 group="simulation.node-classifier.io",
                 version="v1alpha1",
                 namespace=self.namespace,
                 plural="virtualmachines",
                 name=vm_id,
-                body=vm
+                body={'spec': {'utilization': {
+                    'cpu': f"{utilization[0] / 100:.2f}",
+                    'memory': f"{utilization[1] / 100:.2f}"
+                }}}
             )
+            self._last_sent_utilization[vm_id] = utilization
 
             logger.debug(f"Updated {vm_id} utilization: CPU={total_cpu:.2f}, MEM={total_memory:.2f}")
 
@@ -540,15 +914,35 @@ class ScenarioExecutor:
     def _cleanup_completed_tasks(self):
         """Remove completed tasks and update VM utilization."""
         now = datetime.now()
+        expired: Dict[str, Set[int]] = defaultdict(set)
 
-        for vm_id, tasks in list(self.active_tasks.items()):
-            # Remove completed tasks
-            active = [t for t in tasks if t.end_time > now]
+        heap = self._task_heap
+        while heap and heap[0][0] <= now:
+            _, task_id, task = heapq.heappop(heap)
+            expired[task.vm_id].add(task_id)
+            totals = self._vm_totals[task.vm_id]
+            totals[0] -= task.cpu
+            totals[1] -= task.memory
 
-            if len(active) != len(tasks):
-                # Tasks completed, update utilization
+        for vm_id, task_ids in expired.items():
+            active = [t for t in self.active_tasks[vm_id] if id(t) not in task_ids]
+
+            if active:
                 self.active_tasks[vm_id] = active
-                self._update_vm_utilization(vm_id)
+            else:
+                # Drop exhausted VMs outright so float error can't accumulate
+                del self.active_tasks[vm_id]
+                self._vm_totals.pop(vm_id, None)
+
+        # Tasks completed, update utilization
+        for vm_id in expired:
+            self._update_vm_utilization(vm_id)
+
+    def _seconds_until_next_expiry(self) -> float:
+        """Real seconds until the earliest active task ends (inf if there are none)."""
+        if not self._task_heap:
+            return math.inf
+        return max(0.0, (self._task_heap[0][0] - datetime.now()).total_seconds())
 
     def _check_timeline_events(self):
         """Check and execute timeline events."""
@@ -564,15 +958,11 @@ class ScenarioExecutor:
 class ScenarioController:
     """Main controller that watches SimulationScenario CRs."""
 
-    def __init__(self, namespace: str = "default"):
+    def __init__(self, namespace: str = "default", api_client: Optional[client.ApiClient] = None):
         self.namespace = namespace
 
-        try:
-            config.load_incluster_config()
-        except:
-            config.load_kube_config()
-
-        self.custom_api = client.CustomObjectsApi()
+        self.api_client = api_client or _get_api_client()
+        self.custom_api = client.CustomObjectsApi(self.api_client)
         self.executors: Dict[str, ScenarioExecutor] = {}
 
     def run(self):
@@ -615,7 +1005,7 @@ class ScenarioController:
             return
 
         spec = scenario.get('spec', {})
-        executor = ScenarioExecutor(name, spec, self.namespace)
+        executor = ScenarioExecutor(name, spec, self.namespace, self.api_client)
         self.executors[name] = executor
 
         # Start execution in a separate thread
@@ -1,5 +1,5 @@
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
 from node import Node, VM
 import random
@@ -7,6 +7,60 @@ import random
 class ScenarioLoader:
     """Loads and manages node scenarios from JSON files."""
 
+    # Sample scenarios: name -> [(node name, CPU target, memory target)]
+    SAMPLE_SCENARIO_NODES: Dict[str, List[Tuple[str, float, float]]] = {
+        "light_load": [
+            ("node-1", 0.15, 0.20),
+            ("node-2", 0.25, 0.30),
+            ("node-3", 0.10, 0.15),
+            ("node-4", 0.18, 0.25),
+            ("node-5", 0.12, 0.18),
+            ("node-6", 0.22, 0.28),
+        ],
+        "mixed_load": [
+            ("node-1", 0.45, 0.50),
+            ("node-2", 0.75, 0.35),  # High CPU, moderate memory
+            ("node-3", 0.35, 0.65),  # Moderate CPU, higher memory
+            ("node-4", 0.25, 0.45),
+            ("node-5", 0.85, 0.40),  # High CPU, moderate memory
+            ("node-6", 0.55, 0.30),
+            ("node-7", 0.65, 0.55),
+            ("node-8", 0.40, 0.70),  # Higher memory
+            ("node-9", 0.30, 0.35),  # Low-moderate load
+            ("node-10", 0.90, 0.50), # Very high CPU, moderate memory
+            ("node-11", 0.50, 0.25), # Moderate CPU, lower memory
+            ("node-12", 0.70, 0.60), # High CPU, moderate-high memory
+        ],
+        "heavy_load": [
+            ("node-1", 0.85, 0.65),
+            ("node-2", 0.90, 0.70),
+            ("node-3", 0.80, 0.75),
+            ("node-4", 0.88, 0.60),
+            ("node-5", 0.75, 0.55),
+            ("node-6", 0.92, 0.68),
+            ("node-7", 0.87, 0.72),
+            ("node-8", 0.83, 0.78),
+            ("node-9", 0.89, 0.66),
+            ("node-10", 0.78, 0.58),
+        ],
+        "simple_progression": [
+            # Show progression from low to high utilization with realistic pressure
+            ("node-1", 0.10, 0.15),  # Very low - minimal pressure
+            ("node-2", 0.30, 0.35),  # Low - minimal pressure
+            ("node-3", 0.50, 0.45),  # Medium - minimal pressure
+            ("node-4", 0.65, 0.55),  # Getting higher - still minimal pressure
+            ("node-5", 0.72, 0.60),  # Above 70% - pressure starts
+            ("node-6", 0.80, 0.65),  # High - noticeable pressure
+            ("node-7", 0.90, 0.70),  # Very high - significant pressure
+            ("node-8", 0.95, 0.75),  # Near max - high pressure
+        ]
+    }
+
+    @staticmethod
+    def list_scenario_names() -> List[str]:
+        """List sample scenario names without building their nodes and VMs."""
+        return list(ScenarioLoader.SAMPLE_SCENARIO_NODES)
+
     @staticmethod
     def load_scenario(file_path: str) -> Dict[str, List[Node]]:
         """
@@ -197,51 +251,8 @@ class ScenarioLoader:
         random.seed(42)
 
         return {
-            "light_load": [
-                create_realistic_node("node-1", 0.15, 0.20),
-                create_realistic_node("node-2", 0.25, 0.30),
-                create_realistic_node("node-3", 0.10, 0.15),
-                create_realistic_node("node-4", 0.18, 0.25),
-                create_realistic_node("node-5", 0.12, 0.18),
-                create_realistic_node("node-6", 0.22, 0.28),
-            ],
-            "mixed_load": [
-                create_realistic_node("node-1", 0.45, 0.50),
-                create_realistic_node("node-2", 0.75, 0.35),  # High CPU, moderate memory
-                create_realistic_node("node-3", 0.35, 0.65),  # Moderate CPU, higher memory
-                create_realistic_node("node-4", 0.25, 0.45),
-                create_realistic_node("node-5", 0.85, 0.40),  # High CPU, moderate memory
-                create_realistic_node("node-6", 0.55, 0.30),
-                create_realistic_node("node-7", 0.65, 0.55),
-                create_realistic_node("node-8", 0.40, 0.70),  # Higher memory
-                create_realistic_node("node-9", 0.30, 0.35),  # Low-moderate load
-                create_realistic_node("node-10", 0.90, 0.50), # Very high CPU, moderate memory
-                create_realistic_node("node-11", 0.50, 0.25), # Moderate CPU, lower memory
-                create_realistic_node("node-12", 0.70, 0.60), # High CPU, moderate-high memory
-            ],
-            "heavy_load": [
-                create_realistic_node("node-1", 0.85, 0.65),
-                create_realistic_node("node-2", 0.90, 0.70),
-                create_realistic_node("node-3", 0.80, 0.75),
-                create_realistic_node("node-4", 0.88, 0.60),
-                create_realistic_node("node-5", 0.75, 0.55),
-                create_realistic_node("node-6", 0.92, 0.68),
-                create_realistic_node("node-7", 0.87, 0.72),
-                create_realistic_node("node-8", 0.83, 0.78),
-                create_realistic_node("node-9", 0.89, 0.66),
-                create_realistic_node("node-10", 0.78, 0.58),
-            ],
-            "simple_progression": [
-                # Show progression from low to high utilization with realistic pressure
-                create_realistic_node("node-1", 0.10, 0.15),  # Very low - minimal pressure
-                create_realistic_node("node-2", 0.30, 0.35),  # Low - minimal pressure
-                create_realistic_node("node-3", 0.50, 0.45),  # Medium - minimal pressure
-                create_realistic_node("node-4", 0.65, 0.55),  # Getting higher - still minimal pressure
-                create_realistic_node("node-5", 0.72, 0.60),  # Above 70% - pressure starts
-                create_realistic_node("node-6", 0.80, 0.65),  # High - noticeable pressure
-                create_realistic_node("node-7", 0.90, 0.70),  # Very high - significant pressure
-                create_realistic_node("node-8", 0.95, 0.75),  # Near max - high pressure
-            ]
+            scenario: [create_realistic_node(*targets) for targets in node_targets]
+            for scenario, node_targets in ScenarioLoader.SAMPLE_SCENARIO_NODES.items()
         }
 
     @staticmethod